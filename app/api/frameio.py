@@ -8,16 +8,48 @@ The adapter is "dumb" - it only translates HTTP to Python and back.
 All business logic lives in the service layer.
 """
 
+import os
+
 from fastapi import APIRouter, Depends, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.core.domain import FrameIOEvent
 from app.core.services import FrameioWebhookService
 
-router = APIRouter(prefix="/api/v1/frameio", tags=["frameio"])
+router = APIRouter(
+    prefix="/api/v1/frameio",
+    tags=["frameio"],
+    default_response_class=ORJSONResponse,
+)
+
+
+# Cloud Run sets K_SERVICE. There the socket peer is always Google's front end,
+# which appends the address it accepted the connection from to X-Forwarded-For.
+# The environment cannot change for the life of the process, so it is read
+# once at import.
+_BEHIND_CLOUD_RUN_PROXY = bool(os.getenv("K_SERVICE"))
+
+
+def get_client_ip(request: Request) -> str:
+    """
+    Return the caller's IP address for audit logging.
+
+    Behind Cloud Run this is the right-most X-Forwarded-For entry, the one
+    Google's front end appended. Earlier entries come from the caller and can
+    be forged, so they are ignored.
+
+    Reads the ASGI scope directly rather than request.client, which builds a
+    new Address tuple on every access.
+    """
+    if _BEHIND_CLOUD_RUN_PROXY:
+        forwarded_for = request.headers.get("x-forwarded-for")
+        if forwarded_for:
+            return forwarded_for.rsplit(",", 1)[-1].strip()
+    client = request.scope.get("client")
+    return str(client[0]) if client else "unknown"
 
 
-def get_webhook_service_dependency() -> FrameioWebhookService:
+async def get_webhook_service_dependency() -> FrameioWebhookService:
     """
     Placeholder dependency function for FrameioWebhookService.
 
@@ -26,21 +58,48 @@ def get_webhook_service_dependency() -> FrameioWebhookService:
     raise NotImplementedError("FrameioWebhookService dependency must be configured")
 
 
-@router.post("/webhook")
-def frameio_webhook(
-    event: FrameIOEvent,
+async def parse_frameio_event(request: Request) -> FrameIOEvent:
+    """
+    Parse the raw request body into a FrameIOEvent.
+
+    Uses model_validate_json so pydantic-core parses and validates the JSON
+    bytes in a single pass, instead of FastAPI decoding the body into a dict
+    and validating that dict afterwards. A ValidationError is turned into a
+    422 by the centralized handler in main.py.
+    """
+    return FrameIOEvent.model_validate_json(await request.body())
+
+
+# The body is read by parse_frameio_event rather than a body parameter, so the
+# request schema is declared explicitly to keep it in the OpenAPI document.
+_WEBHOOK_OPENAPI_EXTRA = {
+    "requestBody": {
+        "content": {
+            "application/json": {
+                "schema": FrameIOEvent.model_json_schema(),
+            }
+        },
+        "required": True,
+    }
+}
+
+
+@router.post("/webhook", openapi_extra=_WEBHOOK_OPENAPI_EXTRA)
+async def frameio_webhook(
     request: Request,
+    event: FrameIOEvent = Depends(parse_frameio_event),
     webhook_service: FrameioWebhookService = Depends(get_webhook_service_dependency),
 ):
     """
     Receive Frame.io webhook and process event.
 
-    This endpoint uses a sync function so FastAPI runs it in a thread pool,
-    preventing the blocking Pub/Sub call from affecting other requests.
+    The Pub/Sub acknowledgment is awaited on the event loop, so a slow publish
+    does not tie up a thread pool worker. The response is only sent once the
+    event is published, so Frame.io retries anything that was not delivered.
 
-    FastAPI automatically:
-    - Parses JSON body (returns 422 if invalid JSON)
-    - Validates against FrameIOEvent model (returns 422 if validation fails)
+    The body is parsed by parse_frameio_event:
+    - Invalid JSON returns 422
+    - Payloads failing FrameIOEvent validation return 422
 
     Exception handling is centralized in main.py:
     - PublisherError -> 500 (Frame.io retries)
@@ -51,13 +110,13 @@ def frameio_webhook(
     - Payload structure with type, resource, account, workspace, project, user
     """
     # Delegate to core service - all business logic happens there
-    message_id = webhook_service.process_webhook(
+    message_id = await webhook_service.process_webhook(
         event=event,
-        headers=dict(request.headers),
-        client_ip=request.client.host if request.client else "unknown",
+        headers=request.headers,
+        client_ip=get_client_ip(request),
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_200_OK,
         content={"message_id": message_id},
     )
@@ -8,15 +8,18 @@ The adapter is "dumb" - it only translates HTTP to Python and back.
 All business logic lives in the service layer.
 """
 
-import json
 import logging
 from typing import Annotated
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import RedirectResponse, Response
-from pydantic import BaseModel, EmailStr
+from fastapi.responses import Response
+from pydantic import BaseModel, StringConstraints
 
-from app.auth.config import get_auth_config, AuthConfig
+from app.auth.config import AuthConfig, get_auth_config_dependency
+# Shared with get_current_user, so one provider (and one override point)
+# serves both the callback and session checks.
+from app.auth.dependencies import get_session_cookie_service
 from app.auth.services import (
     AuthenticationError,
     MagicLinkService,
@@ -35,10 +38,15 @@ router = APIRouter(prefix="/auth/magic", tags=["authentication"])
 # ============================================================================
 
 
+# Cheap shape check for the address; Firebase rejects anything undeliverable
+# when it generates the link, so a full RFC 5322 parse here is redundant.
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+
+
 class MagicLinkRequest(BaseModel):
     """Request body for magic link send endpoint."""
 
-    email: EmailStr
+    email: Annotated[str, StringConstraints(pattern=EMAIL_PATTERN, max_length=254)]
 
 
 class MagicLinkResponse(BaseModel):
@@ -53,19 +61,26 @@ class MagicLinkResponse(BaseModel):
 # ============================================================================
 
 
-def get_magic_link_service() -> MagicLinkService:
-    """Provide MagicLinkService dependency."""
-    return MagicLinkService()
+# Services only hold configuration, so one instance per process is shared
+# across requests instead of being rebuilt for every call.
+_magic_link_service: MagicLinkService | None = None
+_token_exchange_service: TokenExchangeService | None = None
 
 
-def get_token_exchange_service() -> TokenExchangeService:
-    """Provide TokenExchangeService dependency."""
-    return TokenExchangeService()
+async def get_magic_link_service() -> MagicLinkService:
+    """Provide MagicLinkService dependency (singleton)."""
+    global _magic_link_service
+    if _magic_link_service is None:
+        _magic_link_service = MagicLinkService()
+    return _magic_link_service
 
 
-def get_session_cookie_service() -> SessionCookieService:
-    """Provide SessionCookieService dependency."""
-    return SessionCookieService()
+async def get_token_exchange_service() -> TokenExchangeService:
+    """Provide TokenExchangeService dependency (singleton)."""
+    global _token_exchange_service
+    if _token_exchange_service is None:
+        _token_exchange_service = TokenExchangeService()
+    return _token_exchange_service
 
 
 # ============================================================================
@@ -76,7 +91,6 @@ def get_session_cookie_service() -> SessionCookieService:
 @router.post("/send", response_model=MagicLinkResponse)
 async def send_magic_link(
     request: MagicLinkRequest,
-    config: AuthConfig = Depends(get_auth_config),
     magic_link_service: MagicLinkService = Depends(get_magic_link_service),
 ) -> MagicLinkResponse:
     """
@@ -87,31 +101,24 @@ async def send_magic_link(
 
     Args:
         request: Contains the user's email address
-        config: Auth configuration
         magic_link_service: Service for generating magic links
 
     Returns:
         Success message indicating the link was generated
     """
-    try:
-        config.validate()
-    except ValueError as e:
-        logger.error(f"Configuration error: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e),
-        )
-
+    # Configuration is validated once at startup (see lifespan in main.py)
     try:
         magic_link = magic_link_service.generate_magic_link(request.email)
 
-        # Log magic link as structured JSON for Cloud Logging
-        log_data = {
-            "message": "Magic link generated",
-            "email": request.email,
-            "magic_link": magic_link,
-        }
-        logger.info(json.dumps(log_data))
+        # Log magic link as structured JSON for Cloud Logging.
+        # Skip building and serializing the entry when INFO is filtered out.
+        if logger.isEnabledFor(logging.INFO):
+            log_data = {
+                "message": "Magic link generated",
+                "email": request.email,
+                "magic_link": magic_link,
+            }
+            logger.info(orjson.dumps(log_data).decode())
 
         return MagicLinkResponse(
             status="success",
@@ -132,7 +139,7 @@ async def magic_link_callback(
         str, Query(description="One-time out-of-band code from Firebase")
     ],
     email: Annotated[str | None, Query(description="User email address")] = None,
-    config: AuthConfig = Depends(get_auth_config),
+    config: AuthConfig = Depends(get_auth_config_dependency),
     token_service: TokenExchangeService = Depends(get_token_exchange_service),
     session_service: SessionCookieService = Depends(get_session_cookie_service),
 ) -> Response:
@@ -156,7 +163,7 @@ async def magic_link_callback(
     Returns:
         Redirect response with session cookie set
     """
-    logger.info(f"Magic link callback received - oobCode present: {bool(oobCode)}")
+    logger.info("Magic link callback received - oobCode present: %s", bool(oobCode))
 
     if not email:
         logger.error("Email not provided in callback")
@@ -176,24 +183,18 @@ async def magic_link_callback(
         # Create session cookie
         session_cookie = session_service.create_session_cookie(id_token)
 
-        # Create redirect response with cookie
-        response = RedirectResponse(
-            url="/dashboard",
-            status_code=status.HTTP_302_FOUND,
-        )
+        logger.info("Authentication successful, redirecting to dashboard")
 
-        response.set_cookie(
-            key=config.session_cookie_name,
-            value=session_cookie,
-            max_age=config.session_cookie_max_age,
-            httponly=True,
-            secure=config.base_url.startswith("https"),
-            samesite="lax",
+        # Redirect with the cookie in one Response; the Set-Cookie header is
+        # rendered from attributes precomputed in AuthConfig.
+        return Response(
+            status_code=status.HTTP_302_FOUND,
+            headers={
+                "location": "/dashboard",
+                "set-cookie": config.session_cookie_header(session_cookie),
+            },
         )
 
-        logger.info("Authentication successful, redirecting to dashboard")
-        return response
-
     except AuthenticationError as e:
         logger.error(f"Authentication callback failed: {e}")
         raise HTTPException(
@@ -207,7 +208,16 @@ async def magic_link_callback(
 # ============================================================================
 
 
+# The redirect never varies, so its headers are built once at import. A new
+# Response is still created per request because middleware (SessionMiddleware)
+# appends headers to the response's header list in place.
+_DASHBOARD_REDIRECT_HEADERS = {"location": "/dashboard"}
+
+
 @router.get("/dashboard", include_in_schema=False)
-async def dashboard_redirect():
+async def dashboard_redirect() -> Response:
     """Redirect /auth/magic/dashboard to /dashboard."""
-    return RedirectResponse(url="/dashboard", status_code=status.HTTP_302_FOUND)
+    return Response(
+        status_code=status.HTTP_302_FOUND,
+        headers=_DASHBOARD_REDIRECT_HEADERS,
+    )
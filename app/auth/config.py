@@ -6,7 +6,6 @@ Handles Firebase Admin SDK initialization and environment configuration.
 
 import os
 import logging
-from functools import lru_cache
 
 import firebase_admin
 from firebase_admin import auth as firebase_auth
@@ -24,20 +23,52 @@ class AuthConfig:
 
     Optional:
     - FIREBASE_AUTH_EMULATOR_HOST: Set for local development with emulator
+    - GOOGLE_CLOUD_PROJECT / GCP_PROJECT_ID: Project for Firebase Admin SDK
+
+    Environment variables are read once, when the singleton is created.
     """
 
+    __slots__ = (
+        "firebase_web_api_key",
+        "base_url",
+        "firebase_auth_emulator_host",
+        "project_id",
+        "session_cookie_name",
+        "session_cookie_max_age",
+        "callback_url",
+        "cookie_secure",
+        "session_cookie_attributes",
+    )
+
     def __init__(self):
         self.firebase_web_api_key = os.getenv("FIREBASE_WEB_API_KEY")
         self.base_url = os.getenv("BASE_URL")
         self.firebase_auth_emulator_host = os.getenv("FIREBASE_AUTH_EMULATOR_HOST")
+        self.project_id = os.getenv("GOOGLE_CLOUD_PROJECT") or os.getenv(
+            "GCP_PROJECT_ID"
+        )
         self.session_cookie_name = "session"
         # Session cookie expiration: 14 days (in seconds)
         self.session_cookie_max_age = 60 * 60 * 24 * 14
+        # URL for the magic link callback endpoint. BASE_URL is fixed for the
+        # life of the process, so it is built once instead of per magic link.
+        self.callback_url = f"{self.base_url}/auth/magic/callback"
+        # Session cookie attributes are likewise fixed, so everything in the
+        # Set-Cookie header after "name=value" is rendered once.
+        self.cookie_secure = (self.base_url or "").startswith("https")
+        self.session_cookie_attributes = (
+            f"; HttpOnly; Max-Age={self.session_cookie_max_age}; Path=/; SameSite=lax"
+            + ("; Secure" if self.cookie_secure else "")
+        )
 
-    @property
-    def callback_url(self) -> str:
-        """URL for the magic link callback endpoint."""
-        return f"{self.base_url}/auth/magic/callback"
+    def session_cookie_header(self, value: str) -> str:
+        """
+        Render the Set-Cookie header value for a session cookie.
+
+        Firebase session cookies are JWTs (base64url segments joined by dots),
+        so the value never needs cookie quoting.
+        """
+        return f"{self.session_cookie_name}={value}{self.session_cookie_attributes}"
 
     @property
     def using_emulator(self) -> bool:
@@ -53,10 +84,37 @@ class AuthConfig:
             raise ValueError("FIREBASE_WEB_API_KEY environment variable is required")
 
 
-@lru_cache()
+# Global AuthConfig singleton. A plain global rather than lru_cache: this is
+# read on every auth request and needs neither lru_cache's lock nor key hashing.
+_auth_config: AuthConfig | None = None
+
+
 def get_auth_config() -> AuthConfig:
     """Get authentication configuration (singleton)."""
-    return AuthConfig()
+    global _auth_config
+    if _auth_config is None:
+        _auth_config = AuthConfig()
+    return _auth_config
+
+
+def reset_auth_config() -> None:
+    """
+    Reset the AuthConfig singleton.
+
+    Useful for testing with different environment variables.
+    """
+    global _auth_config
+    _auth_config = None
+
+
+async def get_auth_config_dependency() -> AuthConfig:
+    """
+    Provide the AuthConfig singleton as a FastAPI dependency.
+
+    Declared async so FastAPI resolves it on the event loop; a plain def
+    dependency would be run in the threadpool on every request.
+    """
+    return get_auth_config()
 
 
 def initialize_firebase() -> None:
@@ -70,12 +128,13 @@ def initialize_firebase() -> None:
         logger.debug("Firebase Admin SDK already initialized")
         return
 
-    emulator_host = os.getenv("FIREBASE_AUTH_EMULATOR_HOST")
-    if emulator_host:
-        logger.info(f"Using Firebase Auth Emulator at {emulator_host}")
+    config = get_auth_config()
+    if config.using_emulator:
+        logger.info(
+            f"Using Firebase Auth Emulator at {config.firebase_auth_emulator_host}"
+        )
 
-    # Get project ID from environment
-    project_id = os.getenv("GOOGLE_CLOUD_PROJECT") or os.getenv("GCP_PROJECT_ID")
+    project_id = config.project_id
 
     try:
         options = {"projectId": project_id} if project_id else None
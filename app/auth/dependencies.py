@@ -4,12 +4,12 @@ FastAPI dependencies for authentication.
 Provides dependency injection for session validation.
 """
 
+import asyncio
 import logging
 from typing import Annotated
 
 from fastapi import Cookie, Depends, HTTPException, status
 
-from app.auth.config import get_auth_config, AuthConfig
 from app.auth.services import (
     AuthenticationError,
     SessionCookieService,
@@ -19,24 +19,63 @@ from app.auth.services import (
 logger = logging.getLogger(__name__)
 
 
-def get_session_cookie_service() -> SessionCookieService:
-    """Provide SessionCookieService dependency."""
-    return SessionCookieService()
+# One SessionCookieService per process, shared across requests
+_session_cookie_service: SessionCookieService | None = None
+
+
+async def get_session_cookie_service() -> SessionCookieService:
+    """Provide SessionCookieService dependency (singleton)."""
+    global _session_cookie_service
+    if _session_cookie_service is None:
+        _session_cookie_service = SessionCookieService()
+    return _session_cookie_service
+
+
+async def _verify_session(
+    session: str | None,
+    session_service: SessionCookieService,
+    check_revoked: bool,
+) -> dict:
+    """Verify the session cookie, raising 401 if it is missing or invalid."""
+    if not session:
+        logger.warning("No session cookie provided")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated - no session cookie",
+        )
+
+    # A cache hit is a dict lookup, so it is served on the event loop.
+    claims = session_service.get_cached_claims(session, check_revoked)
+    if claims is not None:
+        return claims
+
+    try:
+        # Verification may call Firebase; keep it off the event loop
+        claims = await asyncio.to_thread(
+            session_service.verify_session_cookie, session, check_revoked
+        )
+        return claims
+    except AuthenticationError as e:
+        logger.warning("Session validation failed: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(e),
+        )
 
 
 async def get_current_user(
     session: Annotated[str | None, Cookie()] = None,
-    config: AuthConfig = Depends(get_auth_config),
     session_service: SessionCookieService = Depends(get_session_cookie_service),
 ) -> dict:
     """
     Dependency to get the current authenticated user.
 
-    Validates the session cookie and returns user claims.
+    Validates the session cookie and returns user claims. Revocation is not
+    checked, so page views cost no Firebase round trip; use
+    get_current_user_strict for endpoints that change state.
 
     Args:
         session: Session cookie from request
-        config: Auth configuration
         session_service: Service for session validation
 
     Returns:
@@ -45,19 +84,20 @@ async def get_current_user(
     Raises:
         HTTPException: 401 if not authenticated
     """
-    if not session:
-        logger.warning("No session cookie provided")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated - no session cookie",
-        )
+    return await _verify_session(session, session_service, check_revoked=False)
 
-    try:
-        claims = session_service.verify_session_cookie(session)
-        return claims
-    except AuthenticationError as e:
-        logger.warning(f"Session validation failed: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-        )
+
+async def get_current_user_strict(
+    session: Annotated[str | None, Cookie()] = None,
+    session_service: SessionCookieService = Depends(get_session_cookie_service),
+) -> dict:
+    """
+    Dependency to get the current user, rejecting revoked sessions.
+
+    Same as get_current_user, but also checks with Firebase that the session
+    has not been revoked (e.g. after sign-out everywhere or a password reset).
+
+    Raises:
+        HTTPException: 401 if not authenticated or the session was revoked
+    """
+    return await _verify_session(session, session_service, check_revoked=True)
@@ -5,10 +5,17 @@ Contains business logic for generating magic links, exchanging tokens,
 and creating session cookies.
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Any
+import threading
+import time
+from typing import Any, cast
+from urllib.parse import quote
 
 import httpx
+import orjson
+from cachetools import TLRUCache
 from firebase_admin import auth as firebase_auth
 
 from app.auth.config import get_auth_config, get_firebase_auth
@@ -16,6 +23,42 @@ from app.auth.config import get_auth_config, get_firebase_auth
 
 logger = logging.getLogger(__name__)
 
+# Verified session claims, keyed by a digest of the cookie. Repeated requests
+# with the same cookie skip signature verification and the revocation RPC
+# until the entry expires; the TTL bounds how stale a revocation can be.
+SESSION_CACHE_TTL_SECONDS = 60
+SESSION_CACHE_MAX_SIZE = 10_000
+
+
+def _session_claims_ttu(_key: bytes, claims: dict[str, Any], now: float) -> float:
+    """Expire an entry after the TTL, or when the cookie itself expires."""
+    expires_at = now + SESSION_CACHE_TTL_SECONDS
+    cookie_exp = claims.get("exp")
+    if isinstance(cookie_exp, (int, float)):
+        return min(expires_at, cookie_exp)
+    return expires_at
+
+
+# The timer is wall-clock time so it is comparable with the "exp" claim.
+_session_claims_cache: TLRUCache = TLRUCache(
+    maxsize=SESSION_CACHE_MAX_SIZE, ttu=_session_claims_ttu, timer=time.time
+)
+_session_claims_lock = threading.Lock()
+
+
+def _session_cache_key(session_cookie: str, check_revoked: bool) -> bytes:
+    """
+    Digest the cookie so raw session tokens are not kept as cache keys.
+
+    Revocation-checked results get their own key, so a lighter verification
+    is never served to a caller that asked for the revocation check.
+    """
+    return hashlib.blake2b(
+        session_cookie.encode(),
+        digest_size=16,
+        person=b"revoked" if check_revoked else b"",
+    ).digest()
+
 
 class AuthenticationError(Exception):
     """Raised when authentication fails."""
@@ -23,12 +66,57 @@ class AuthenticationError(Exception):
     pass
 
 
+# Shared HTTP client for Firebase REST calls. Reusing it keeps connections to
+# identitytoolkit.googleapis.com alive instead of paying a TLS handshake on
+# every magic link callback. Its pooled connections belong to the event loop
+# that opened them, so the client is rebuilt if it is used from another loop
+# (e.g. a TestClient without a lifespan runs each request on its own loop).
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client for the running event loop."""
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client_loop is not loop:
+        # A client left over from a previous loop cannot be closed from this
+        # one; dropping it releases its connections with that loop.
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(5.0),
+            limits=httpx.Limits(max_keepalive_connections=10),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client. Call on application shutdown."""
+    global _http_client, _http_client_loop
+    if _http_client is not None:
+        if _http_client_loop is asyncio.get_running_loop():
+            await _http_client.aclose()
+        _http_client = None
+        _http_client_loop = None
+
+
 class MagicLinkService:
     """Service for generating and handling magic links."""
 
+    __slots__ = ("config", "_firebase_auth", "_callback_url_prefix")
+
     def __init__(self):
         self.config = get_auth_config()
-        self._firebase_auth = get_firebase_auth()
+        self._firebase_auth: Any = None
+        # Firebase doesn't add the email to the callback, so it is appended
+        # as the only query parameter after this fixed prefix.
+        self._callback_url_prefix = f"{self.config.callback_url}?email="
+
+    def _get_firebase_auth(self) -> Any:
+        """Resolve the Firebase Auth client on first use."""
+        if self._firebase_auth is None:
+            self._firebase_auth = get_firebase_auth()
+        return self._firebase_auth
 
     def generate_magic_link(self, email: str) -> str:
         """
@@ -45,11 +133,7 @@ class MagicLinkService:
         """
         try:
             # Include email in callback URL since Firebase doesn't add it
-            from urllib.parse import urlencode
-
-            callback_with_email = (
-                f"{self.config.callback_url}?{urlencode({'email': email})}"
-            )
+            callback_with_email = self._callback_url_prefix + quote(email, safe="@")
 
             # Configure the action code settings
             action_code_settings = firebase_auth.ActionCodeSettings(
@@ -58,16 +142,11 @@ class MagicLinkService:
             )
 
             # Generate the email sign-in link
-            link = self._firebase_auth.generate_sign_in_with_email_link(
+            link = self._get_firebase_auth().generate_sign_in_with_email_link(
                 email=email,
                 action_code_settings=action_code_settings,
             )
 
-            logger.info(
-                f"Generated magic link for email: {email}",
-                extra={"email": email},
-            )
-
             return str(link)
 
         except Exception as e:
@@ -75,11 +154,21 @@ class MagicLinkService:
             raise AuthenticationError(f"Failed to generate magic link: {e}")
 
 
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
 class TokenExchangeService:
     """Service for exchanging oobCode for Firebase tokens."""
 
+    __slots__ = ("config", "_signin_url")
+
     def __init__(self):
         self.config = get_auth_config()
+        # Endpoint and API key are fixed for the process, so the full URL is
+        # built once rather than on every callback.
+        self._signin_url = (
+            f"{self._get_signin_url()}?key={self.config.firebase_web_api_key}"
+        )
 
     def _get_signin_url(self) -> str:
         """Get the appropriate sign-in URL based on environment."""
@@ -110,42 +199,42 @@ class TokenExchangeService:
         Raises:
             AuthenticationError: If token exchange fails
         """
-        url = f"{self._get_signin_url()}?key={self.config.firebase_web_api_key}"
-
         payload = {
             "oobCode": oob_code,
             "email": email,
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=payload)
-
-                if response.status_code != 200:
-                    error_data = response.json()
-                    error_message = error_data.get("error", {}).get(
-                        "message", "Unknown error"
-                    )
-                    logger.error(
-                        f"Firebase sign-in failed: {error_message}",
-                        extra={"status_code": response.status_code},
-                    )
-                    raise AuthenticationError(
-                        f"Firebase sign-in failed: {error_message}"
-                    )
-
-                data = response.json()
-                id_token = data.get("idToken")
-
-                if not id_token:
-                    raise AuthenticationError("No ID token in response")
-
-                logger.info(
-                    "Successfully exchanged oobCode for ID token",
-                    extra={"email": email},
+            response = await get_http_client().post(
+                self._signin_url, content=orjson.dumps(payload), headers=_JSON_HEADERS
+            )
+
+            # Parse the body once; error responses are JSON too, but a proxy
+            # in the way may answer with something that is not.
+            try:
+                data = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                data = {}
+
+            if response.status_code != 200:
+                error_message = data.get("error", {}).get("message", "Unknown error")
+                logger.error(
+                    f"Firebase sign-in failed: {error_message}",
+                    extra={"status_code": response.status_code},
                 )
+                raise AuthenticationError(f"Firebase sign-in failed: {error_message}")
+
+            id_token = data.get("idToken")
 
-                return str(id_token)
+            if not id_token:
+                raise AuthenticationError("No ID token in response")
+
+            logger.info(
+                "Successfully exchanged oobCode for ID token",
+                extra={"email": email},
+            )
+
+            return str(id_token)
 
         except httpx.RequestError as e:
             logger.error(f"Network error during token exchange: {e}")
@@ -155,9 +244,17 @@ class TokenExchangeService:
 class SessionCookieService:
     """Service for creating and verifying session cookies."""
 
+    __slots__ = ("config", "_firebase_auth")
+
     def __init__(self):
         self.config = get_auth_config()
-        self._firebase_auth = get_firebase_auth()
+        self._firebase_auth: Any = None
+
+    def _get_firebase_auth(self) -> Any:
+        """Resolve the Firebase Auth client on first use."""
+        if self._firebase_auth is None:
+            self._firebase_auth = get_firebase_auth()
+        return self._firebase_auth
 
     def create_session_cookie(self, id_token: str) -> str:
         """
@@ -174,7 +271,7 @@ class SessionCookieService:
         """
         try:
             # Create session cookie (expires in 14 days)
-            session_cookie = self._firebase_auth.create_session_cookie(
+            session_cookie = self._get_firebase_auth().create_session_cookie(
                 id_token=id_token,
                 expires_in=self.config.session_cookie_max_age,
             )
@@ -192,32 +289,69 @@ class SessionCookieService:
             logger.error(f"Failed to create session cookie: {e}")
             raise AuthenticationError(f"Failed to create session cookie: {e}")
 
+    def get_cached_claims(
+        self, session_cookie: str, check_revoked: bool = False
+    ) -> dict[str, Any] | None:
+        """
+        Return cached claims for a previously verified cookie, if any.
+
+        This is only a dict lookup, so it can run on the event loop; callers
+        fall back to verify_session_cookie on a miss.
+
+        Args:
+            session_cookie: The session cookie string
+            check_revoked: Whether the cached result must have been verified
+                with the revocation check
+
+        Returns:
+            Cached claims (shared with the cache, do not modify), or None
+        """
+        cache_key = _session_cache_key(session_cookie, check_revoked)
+        with _session_claims_lock:
+            cached_claims = _session_claims_cache.get(cache_key)
+        return cast(dict[str, Any] | None, cached_claims)
+
     def verify_session_cookie(
-        self, session_cookie: str, check_revoked: bool = True
+        self, session_cookie: str, check_revoked: bool = False
     ) -> dict[str, Any]:
         """
         Verify a session cookie and return decoded claims.
 
+        Successful verifications are cached for SESSION_CACHE_TTL_SECONDS, or
+        until the cookie's "exp" claim if sooner, so only a cache miss calls
+        Firebase (and performs the revocation check).
+
         Args:
             session_cookie: The session cookie string
-            check_revoked: Whether to check if the token has been revoked
+            check_revoked: Whether to check if the token has been revoked.
+                This costs a Firebase RPC, so it is reserved for endpoints
+                that change state.
 
         Returns:
-            Decoded token claims (includes uid, email, etc.)
+            Decoded token claims (includes uid, email, etc.). The dict is
+            shared with the cache, so callers must not modify it.
 
         Raises:
             AuthenticationError: If verification fails
         """
+        cached_claims = self.get_cached_claims(session_cookie, check_revoked)
+        if cached_claims is not None:
+            return cached_claims
+
         try:
-            decoded_claims = self._firebase_auth.verify_session_cookie(
+            decoded_claims = self._get_firebase_auth().verify_session_cookie(
                 session_cookie=session_cookie,
                 check_revoked=check_revoked,
             )
 
             logger.debug(
-                f"Session cookie verified for user: {decoded_claims.get('uid')}"
+                "Session cookie verified for user: %s", decoded_claims.get("uid")
             )
-            return dict(decoded_claims)
+            claims = cast(dict[str, Any], decoded_claims)
+            cache_key = _session_cache_key(session_cookie, check_revoked)
+            with _session_claims_lock:
+                _session_claims_cache[cache_key] = claims
+            return claims
 
         except firebase_auth.InvalidSessionCookieError:
             logger.warning("Invalid session cookie")
@@ -55,6 +55,8 @@ class FrameIOEvent(BaseModel):
     model_config = ConfigDict(
         # Populate by field name when serializing (use event_type, not type)
         populate_by_name=True,
+        # Events are immutable once received (and therefore hashable)
+        frozen=True,
     )
 
     def to_dict(self) -> Dict[str, Any]:
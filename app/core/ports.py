@@ -21,10 +21,13 @@ class EventPublisher(Protocol):
     adapter is responsible for serialization.
     """
 
-    def publish(self, event: FrameIOEvent) -> Optional[str]:
+    async def publish(self, event: FrameIOEvent) -> Optional[str]:
         """
         Publish a domain event.
 
+        Implementations must not block the event loop while waiting for the
+        broker to acknowledge the message.
+
         Args:
             event: The domain event to publish
 
@@ -5,10 +5,12 @@ This module contains the business logic, independent of
 infrastructure details like HTTP or message queues.
 """
 
-import json
 import logging
+import time
 from datetime import UTC, datetime
-from typing import Dict
+from typing import Awaitable, Callable, Mapping, Optional
+
+import orjson
 
 from app.core.domain import FrameIOEvent
 from app.core.exceptions import PublisherError
@@ -16,6 +18,27 @@ from app.core.ports import EventPublisher
 
 logger = logging.getLogger(__name__)
 
+# (epoch second, ISO 8601 string) for the most recent log timestamp
+_log_timestamp_cache: tuple[int, str] = (-1, "")
+
+
+def _log_timestamp() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string at second resolution.
+
+    The string is only rebuilt when the wall-clock second changes, so bursts
+    of webhooks share one formatted value. The cache is a single tuple so a
+    concurrent reader never sees a second paired with another second's string.
+    """
+    global _log_timestamp_cache
+    now = int(time.time())
+    cached_second, cached_value = _log_timestamp_cache
+    if now == cached_second:
+        return cached_value
+    value = datetime.fromtimestamp(now, UTC).isoformat()
+    _log_timestamp_cache = (now, value)
+    return value
+
 
 class FrameioWebhookService:
     """
@@ -24,6 +47,8 @@ class FrameioWebhookService:
     This is the core use case logic, independent of HTTP or infrastructure.
     """
 
+    __slots__ = ("event_publisher", "_publish")
+
     def __init__(self, event_publisher: EventPublisher):
         """
         Initialize the webhook service.
@@ -32,11 +57,15 @@ class FrameioWebhookService:
             event_publisher: Publisher for distributing events
         """
         self.event_publisher = event_publisher
+        # Bound once: the publisher is fixed for the life of the service
+        self._publish: Callable[[FrameIOEvent], Awaitable[Optional[str]]] = (
+            event_publisher.publish
+        )
 
-    def process_webhook(
+    async def process_webhook(
         self,
         event: FrameIOEvent,
-        headers: Dict[str, str],
+        headers: Mapping[str, str],
         client_ip: str,
     ) -> str:
         """
@@ -49,7 +78,7 @@ class FrameioWebhookService:
 
         Args:
             event: Parsed Frame.io event domain model
-            headers: HTTP request headers
+            headers: HTTP request headers (copied only when logged)
             client_ip: Client IP address
 
         Returns:
@@ -59,37 +88,38 @@ class FrameioWebhookService:
             PublisherError: If publishing fails or returns no message ID
         """
         # Log webhook data as structured JSON for Cloud Logging
-        # Single log entry with jsonPayload and automatic trace correlation
-        log_data = {
-            "message": "FRAME.IO WEBHOOK RECEIVED",
-            "event_type": event.event_type,
-            "resource_type": event.resource_type,
-            "resource_id": event.resource_id,
-            "account_id": event.account_id,
-            "workspace_id": event.workspace_id,
-            "project_id": event.project_id,
-            "user_id": event.user_id,
-            "user_agent": headers.get("user-agent", ""),
-            "timestamp": datetime.now(UTC).isoformat(),
-            "client_ip": client_ip,
-            "headers": headers,
-            "payload": event.to_dict(),
-        }
-        logger.info(json.dumps(log_data, default=str))
+        # Single log entry with jsonPayload and automatic trace correlation.
+        # Skip building and serializing the entry when INFO is filtered out.
+        if logger.isEnabledFor(logging.INFO):
+            log_data = {
+                "message": "FRAME.IO WEBHOOK RECEIVED",
+                # All event fields (event_type, resource_*, *_id) in one call
+                **event.model_dump(),
+                "user_agent": headers.get("user-agent", ""),
+                "timestamp": _log_timestamp(),
+                "client_ip": client_ip,
+                "headers": dict(headers),
+                # No "payload" copy: the event fields above are all FrameIOEvent
+                # holds, so the nested payload is fully recoverable from them.
+            }
+            # Every value is a str, so orjson needs no default= fallback
+            logger.info(orjson.dumps(log_data).decode())
 
         # Publish event to downstream consumers
         # Pass the domain object - infrastructure layer handles serialization
         try:
-            message_id = self.event_publisher.publish(event)
+            message_id = await self._publish(event)
         except Exception as e:
-            # Publishing failed - raise domain exception
-            raise PublisherError(f"Failed to publish event: {str(e)}") from e
+            # Publishing failed - raise domain exception. The cause is chained
+            # rather than formatted here; the handler in main.py renders it
+            # only if the error is actually logged.
+            raise PublisherError("Failed to publish event") from e
 
         # Enforce business rule: publishing must return a message ID
         if not message_id:
             raise PublisherError("Publisher returned no message ID")
 
-        logger.info(f"Published event with message ID: {message_id}")
+        logger.info("Published event with message ID: %s", message_id)
         return message_id
 
     def shutdown(self) -> None:
@@ -5,11 +5,12 @@ This is a driven adapter that implements the EventPublisher port
 defined in the core domain.
 """
 
-import json
+import asyncio
 import logging
 import os
 from typing import Optional
 
+import orjson
 from google.api_core import exceptions
 from google.cloud import pubsub_v1
 
@@ -17,6 +18,16 @@ from app.core.domain import FrameIOEvent
 
 logger = logging.getLogger(__name__)
 
+# Client-side batch settings. These equal google-cloud-pubsub's defaults and
+# are pinned on purpose: the client already batches concurrent publishes with
+# them, and max_latency adds directly to webhook response time, so a library
+# upgrade should not be able to change it silently.
+PUBLISH_BATCH_SETTINGS = pubsub_v1.types.BatchSettings(
+    max_messages=100,
+    max_bytes=1_000_000,
+    max_latency=0.01,
+)
+
 
 class GooglePubSubPublisher:
     """
@@ -49,7 +60,9 @@ class GooglePubSubPublisher:
         if not self.topic_name:
             raise ValueError("PUBSUB_TOPIC_NAME must be set for Pub/Sub publisher")
 
-        self.publisher = pubsub_v1.PublisherClient()
+        self.publisher = pubsub_v1.PublisherClient(
+            batch_settings=PUBLISH_BATCH_SETTINGS
+        )
         self.topic_path = self.publisher.topic_path(self.project_id, self.topic_name)
 
         if self.emulator_host:
@@ -57,7 +70,7 @@ class GooglePubSubPublisher:
         else:
             logger.info(f"Pub/Sub publisher initialized for topic: {self.topic_path}")
 
-    def publish(self, event: FrameIOEvent) -> Optional[str]:
+    async def publish(self, event: FrameIOEvent) -> Optional[str]:
         """
         Publish a domain event to the Pub/Sub topic.
 
@@ -65,9 +78,9 @@ class GooglePubSubPublisher:
         domain object to JSON for Pub/Sub. The core domain works with domain
         objects; this adapter translates them to infrastructure format.
 
-        Note: This method blocks while waiting for Pub/Sub acknowledgment.
-        The endpoint uses a sync function so FastAPI runs it in a thread pool,
-        preventing this from blocking other requests.
+        The Pub/Sub client returns a concurrent future that is resolved by its
+        background thread; it is wrapped and awaited here so waiting for the
+        acknowledgment never blocks the event loop or a worker thread.
 
         Args:
             event: The domain event to publish
@@ -76,9 +89,9 @@ class GooglePubSubPublisher:
             Message ID if successful, None if failed
         """
         try:
-            # Serialize domain object to JSON (infrastructure concern)
-            message_data = event.to_dict()
-            message_bytes = json.dumps(message_data, default=str).encode("utf-8")
+            # Serialize domain object to JSON (infrastructure concern).
+            # orjson returns UTF-8 bytes directly, ready for Pub/Sub.
+            message_bytes = orjson.dumps(event.to_dict())
 
             # Extract attributes from domain object (for Pub/Sub message metadata)
             attributes = {
@@ -93,8 +106,10 @@ class GooglePubSubPublisher:
             )
 
             # Wait for the publish to complete and get message ID
-            message_id: str = future.result(timeout=5.0)
-            logger.info(f"Published message to Pub/Sub: {message_id}")
+            message_id: str = await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=5.0
+            )
+            logger.info("Published message to Pub/Sub: %s", message_id)
 
             return message_id
 
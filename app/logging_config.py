@@ -4,10 +4,70 @@ Logging configuration for Cloud Run and local environments.
 Automatically detects Cloud Run environment and configures appropriate logging:
 - Cloud Run: google-cloud-logging with trace correlation
 - Local/Test: Standard Python logging to stdout
+
+In both cases the handlers are served from a queue: request handlers only
+enqueue log records, and a background QueueListener thread does the blocking
+I/O.
 """
 
+import atexit
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_queue_listener: QueueListener | None = None
+
+
+def _serve_root_handlers_from_queue(handlers: list[logging.Handler]) -> None:
+    """
+    Move handlers off the root logger and behind a QueueHandler.
+
+    The root logger keeps a single QueueHandler, so logging on the request
+    path is an enqueue. A QueueListener thread passes each record to the
+    original handlers, honouring their levels. The listener is stopped at
+    exit so queued records are still written.
+    """
+    global _queue_listener
+    if not handlers or _queue_listener is not None:
+        return
+
+    root = logging.getLogger()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    atexit.register(stop_queue_listener)
+
+
+def stop_queue_listener() -> None:
+    """Write any queued records and stop the listener thread, if running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+def _setup_stdout_logging() -> None:
+    """
+    Configure plain text logging, as logging.basicConfig would.
+
+    Like basicConfig, this does nothing if the root logger already has
+    handlers (for example, ones installed by pytest).
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+    _serve_root_handlers_from_queue([handler])
 
 
 def setup_global_logging() -> None:
@@ -26,6 +86,9 @@ def setup_global_logging() -> None:
     When running locally or in tests:
     - Uses standard Python logging to stdout
     - Simple text format for development
+
+    Either way, the configured handlers run on a QueueListener thread rather
+    than on the thread that logs.
     """
     # Check if running in Cloud Run
     # Cloud Run sets K_SERVICE environment variable
@@ -36,21 +99,20 @@ def setup_global_logging() -> None:
             # Import and setup Cloud Logging
             import google.cloud.logging
 
+            root = logging.getLogger()
+            existing_handlers = list(root.handlers)
             client = google.cloud.logging.Client()
             client.setup_logging()
+            _serve_root_handlers_from_queue(
+                [h for h in root.handlers if h not in existing_handlers]
+            )
             logging.info("Cloud Logging initialized for Cloud Run")
         except Exception as e:
             # Fallback if Cloud Logging setup fails
-            logging.basicConfig(
-                level=logging.INFO,
-                format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            )
+            _setup_stdout_logging()
             logging.warning(
                 f"Failed to initialize Cloud Logging, using stdout: {str(e)}"
             )
     else:
         # Local development or testing - use stdout
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        )
+        _setup_stdout_logging()
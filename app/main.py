@@ -9,7 +9,6 @@ import logging
 import os
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
-from functools import lru_cache
 
 # Configure logging FIRST, before other local imports
 from app.logging_config import setup_global_logging
@@ -18,15 +17,23 @@ setup_global_logging()
 
 # Now import other modules (they will use the configured logging)
 from fastapi import Depends, FastAPI, Request, status  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
 from fastapi.exceptions import RequestValidationError  # noqa: E402
-from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.responses import JSONResponse, Response  # noqa: E402
+import orjson  # noqa: E402
+from pydantic import ValidationError  # noqa: E402
 from starlette.middleware.sessions import SessionMiddleware  # noqa: E402
 
 from app.api import frameio  # noqa: E402
 from app.api import magic  # noqa: E402
 from app.oauth import router as oauth_router  # noqa: E402
 from app.api.frameio import get_webhook_service_dependency  # noqa: E402
-from app.auth.dependencies import get_current_user  # noqa: E402
+from app.auth.config import get_auth_config, initialize_firebase  # noqa: E402
+from app.auth.dependencies import (  # noqa: E402
+    get_current_user,
+    get_session_cookie_service,
+)
+from app.auth.services import close_http_client  # noqa: E402
 from app.core.exceptions import PublisherError  # noqa: E402
 from app.core.services import FrameioWebhookService  # noqa: E402
 from app.infrastructure.pubsub_publisher import GooglePubSubPublisher  # noqa: E402
@@ -46,16 +53,32 @@ async def lifespan(app: FastAPI):
 
     Handles startup and shutdown events using modern FastAPI pattern.
     """
-    # Startup: nothing to do (dependencies are lazy-loaded)
     logger.info("Application starting up...")
+    # Fail fast on missing auth configuration rather than on the first login
+    get_auth_config().validate()
+    # Startup: initialize Firebase and build the auth service singletons here
+    # so the first authenticated request does not pay for it. Failure is not
+    # fatal: webhooks do not need auth, and auth retries on first use.
+    try:
+        initialize_firebase()
+        await get_session_cookie_service()
+        await magic.get_magic_link_service()
+        await magic.get_token_exchange_service()
+    except Exception as e:
+        logger.warning(f"Auth warm-up failed, deferring to first use: {e}")
     yield
     # Shutdown: cleanup resources
     logger.info("Shutting down application...")
     try:
-        get_event_publisher().close()
+        if _event_publisher is not None:
+            _event_publisher.close()
     except Exception as e:
         # Gracefully handle shutdown errors (e.g., client not initialized)
         logger.warning(f"Error closing event publisher during shutdown: {e}")
+    try:
+        await close_http_client()
+    except Exception as e:
+        logger.warning(f"Error closing HTTP client during shutdown: {e}")
 
 
 app = FastAPI(
@@ -81,25 +104,37 @@ app.add_middleware(
 # ============================================================================
 
 
-@lru_cache()
-def get_event_publisher() -> GooglePubSubPublisher:
-    """
-    Provide the event publisher dependency.
+# One publisher per process. A plain global behind an async provider, so the
+# webhook's dependency chain resolves on the event loop instead of sending a
+# sync lru_cache call through the threadpool on every request.
+_event_publisher: GooglePubSubPublisher | None = None
+
+
+async def get_event_publisher() -> GooglePubSubPublisher:
+    """Provide the event publisher dependency (singleton)."""
+    global _event_publisher
+    if _event_publisher is None:
+        _event_publisher = GooglePubSubPublisher()
+    return _event_publisher
 
-    Uses lru_cache for singleton behavior - same instance across requests.
-    """
-    return GooglePubSubPublisher()
 
+# One webhook service per process, wired to the publisher above
+_webhook_service: FrameioWebhookService | None = None
 
-def get_webhook_service(
+
+async def get_webhook_service(
     event_publisher: GooglePubSubPublisher = Depends(get_event_publisher),
 ) -> FrameioWebhookService:
     """
-    Provide the webhook service dependency.
+    Provide the webhook service dependency (singleton).
 
     This is where we wire the core service with its infrastructure dependencies.
+    The service is stateless, so it is built once instead of on every request.
     """
-    return FrameioWebhookService(event_publisher=event_publisher)
+    global _webhook_service
+    if _webhook_service is None:
+        _webhook_service = FrameioWebhookService(event_publisher=event_publisher)
+    return _webhook_service
 
 
 # Override the dependency in the router to use our wired service
@@ -111,6 +146,13 @@ app.dependency_overrides[get_webhook_service_dependency] = get_webhook_service
 # ============================================================================
 
 
+# The publish-failure body never varies, so it is serialized once at import.
+# A new Response is still built per error since middleware mutates headers.
+_PUBLISHER_ERROR_BODY = orjson.dumps(
+    {"status": "error", "message": "Failed to publish event - please retry"}
+)
+
+
 @app.exception_handler(PublisherError)
 async def publisher_error_handler(request: Request, exc: PublisherError):
     """
@@ -119,13 +161,20 @@ async def publisher_error_handler(request: Request, exc: PublisherError):
     Returns 500 Internal Server Error so Frame.io will retry the webhook.
     This prevents data loss when Pub/Sub is temporarily unavailable.
     """
-    logger.error(f"Publisher error: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    # The underlying cause is chained, not formatted into the message; it is
+    # rendered here, once. Formatting the full traceback on every failed
+    # publish amplifies load during an outage, so it is only included when
+    # DEBUG logging is enabled.
+    logger.error(
+        "Publisher error: %s (cause: %r)",
+        exc,
+        exc.__cause__,
+        exc_info=logger.isEnabledFor(logging.DEBUG),
+    )
+    return Response(
+        content=_PUBLISHER_ERROR_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "status": "error",
-            "message": "Failed to publish event - please retry",
-        },
+        media_type="application/json",
     )
 
 
@@ -141,7 +190,7 @@ async def validation_error_handler(request: Request, exc: RequestValidationError
     body = await request.body()
     logger.error(
         f"Validation error: {str(exc)}\n"
-        f"Raw body: {body.decode('utf-8') if body else 'empty'}"
+        f"Raw body: {body.decode('utf-8', errors='replace') if body else 'empty'}"
     )
 
     return JSONResponse(
@@ -149,11 +198,33 @@ async def validation_error_handler(request: Request, exc: RequestValidationError
         content={
             "status": "error",
             "message": "Invalid payload schema",
-            "details": exc.errors(),
+            "details": jsonable_encoder(exc.errors()),
         },
     )
 
 
+@app.exception_handler(ValidationError)
+async def model_validation_error_handler(request: Request, exc: ValidationError):
+    """
+    Handle payloads rejected by an adapter's model_validate_json call.
+
+    Reported like RequestValidationError, with the same "body" location
+    prefix FastAPI uses. Each error's "input" is dropped: for invalid JSON it
+    is the raw body bytes, which may not be UTF-8 and should not be echoed
+    back in the response.
+    """
+    errors = [
+        {
+            "type": error["type"],
+            "loc": ("body", *error["loc"]),
+            "msg": error["msg"],
+            **({"ctx": error["ctx"]} if "ctx" in error else {}),
+        }
+        for error in exc.errors(include_url=False)
+    ]
+    return await validation_error_handler(request, RequestValidationError(errors))
+
+
 # ============================================================================
 # Health Check Endpoints
 # ============================================================================
@@ -196,7 +267,7 @@ async def dashboard(current_user: dict = Depends(get_current_user)):
     user_email = current_user.get("email", "unknown")
     user_uid = current_user.get("uid", "unknown")
 
-    logger.info(f"Dashboard accessed by user: {user_uid}")
+    logger.info("Dashboard accessed by user: %s", user_uid)
 
     return {
         "status": "success",
@@ -225,4 +296,7 @@ if __name__ == "__main__":
     import uvicorn
 
     port = int(os.getenv("PORT", 8080))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Pin the C event loop and HTTP parser shipped with uvicorn[standard]
+    # rather than relying on auto-detection, so a missing wheel fails at boot
+    # instead of silently falling back to asyncio + h11.
+    uvicorn.run(app, host="0.0.0.0", port=port, loop="uvloop", http="httptools")
@@ -156,5 +156,5 @@ def reset_oauth_registry() -> None:
     _oauth_registry = None
 
 
-# List of supported providers (for validation)
-SUPPORTED_PROVIDERS = ["google", "adobe"]
+# Supported providers (for validation); a frozenset for O(1) membership checks
+SUPPORTED_PROVIDERS = frozenset({"google", "adobe"})
@@ -10,7 +10,7 @@ from typing import Annotated
 from authlib.integrations.starlette_client import OAuth
 from fastapi import Depends, HTTPException, status
 
-from app.auth.dependencies import get_current_user
+from app.auth.dependencies import get_current_user, get_current_user_strict
 from app.oauth.config import (
     get_oauth_config,
     get_oauth_registry,
@@ -22,8 +22,11 @@ from app.users.repository import get_user_repository, UserRepository
 
 logger = logging.getLogger(__name__)
 
+# Rendered once for the "unknown provider" error message
+_SUPPORTED_LIST = ", ".join(sorted(SUPPORTED_PROVIDERS))
 
-def get_oauth(
+
+async def get_oauth(
     config: Annotated[OAuthConfig, Depends(get_oauth_config)],
 ) -> OAuth:
     """
@@ -34,7 +37,7 @@ def get_oauth(
     return get_oauth_registry()
 
 
-def get_repository() -> UserRepository:
+async def get_repository() -> UserRepository:
     """Provide UserRepository dependency."""
     return get_user_repository()
 
@@ -59,7 +62,7 @@ async def validate_provider(
     if provider not in SUPPORTED_PROVIDERS:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Unknown provider: {provider}. Supported: {SUPPORTED_PROVIDERS}",
+            detail=f"Unknown provider: {provider}. Supported: {_SUPPORTED_LIST}",
         )
 
     if not config.is_provider_configured(provider):
@@ -73,6 +76,7 @@ async def validate_provider(
 
 # Type aliases for cleaner dependency injection
 CurrentUser = Annotated[dict, Depends(get_current_user)]
+StrictCurrentUser = Annotated[dict, Depends(get_current_user_strict)]
 ValidProvider = Annotated[str, Depends(validate_provider)]
 OAuthRegistry = Annotated[OAuth, Depends(get_oauth)]
 Repository = Annotated[UserRepository, Depends(get_repository)]
@@ -19,6 +19,7 @@ from app.oauth.dependencies import (
     CurrentUser,
     OAuthRegistry,
     Repository,
+    StrictCurrentUser,
     ValidProvider,
 )
 
@@ -56,7 +57,8 @@ async def connect(
     redirect_uri = config.get_callback_url(provider)
 
     logger.info(
-        f"Starting OAuth flow for provider: {provider}",
+        "Starting OAuth flow for provider: %s",
+        provider,
         extra={"user_uid": user.get("uid"), "provider": provider},
     )
 
@@ -74,7 +76,7 @@ async def connect(
 async def callback(
     provider: ValidProvider,
     request: Request,
-    user: CurrentUser,
+    user: StrictCurrentUser,
     oauth: OAuthRegistry,
     repository: Repository,
 ):
@@ -100,7 +102,8 @@ async def callback(
     user_uid: str = user["uid"]
 
     logger.info(
-        f"OAuth callback received for provider: {provider}",
+        "OAuth callback received for provider: %s",
+        provider,
         extra={"user_uid": user_uid, "provider": provider},
     )
 
@@ -135,7 +138,8 @@ async def callback(
         )
 
     logger.info(
-        f"Token received from {provider}",
+        "Token received from %s",
+        provider,
         extra={
             "user_uid": user_uid,
             "provider": provider,
@@ -158,7 +162,8 @@ async def callback(
         )
 
     logger.info(
-        f"Successfully connected {provider} for user",
+        "Successfully connected %s for user",
+        provider,
         extra={"user_uid": user_uid, "provider": provider},
     )
 
@@ -201,7 +206,7 @@ async def list_connections(
 @router.delete("/{provider}")
 async def disconnect(
     provider: ValidProvider,
-    user: CurrentUser,
+    user: StrictCurrentUser,
     repository: Repository,
 ):
     """
@@ -228,7 +233,8 @@ async def disconnect(
         )
 
     logger.info(
-        f"Disconnected {provider} for user",
+        "Disconnected %s for user",
+        provider,
         extra={"user_uid": user_uid, "provider": provider},
     )
 
@@ -143,17 +143,17 @@ class InMemoryUserRepository(UserRepository):
         if user.uid in self._users:
             raise ValueError(f"User {user.uid} already exists")
         self._users[user.uid] = user
-        logger.info(f"Created user: {user.uid}")
+        logger.info("Created user: %s", user.uid)
         return user
 
     async def get_or_create(self, uid: str, email: str) -> User:
         if uid in self._users:
-            logger.debug(f"Found existing user: {uid}")
+            logger.debug("Found existing user: %s", uid)
             return self._users[uid]
 
         user = User(uid=uid, email=email)
         self._users[uid] = user
-        logger.info(f"Created new user: {uid}")
+        logger.info("Created new user: %s", uid)
         return user
 
     async def save_token(
@@ -163,7 +163,7 @@ class InMemoryUserRepository(UserRepository):
         user = self._users.get(uid)
         if not user:
             # This shouldn't happen in normal flow, but handle gracefully
-            logger.warning(f"User {uid} not found, creating placeholder")
+            logger.warning("User %s not found, creating placeholder", uid)
             user = User(uid=uid, email="unknown@placeholder.com")
             self._users[uid] = user
 
@@ -174,7 +174,7 @@ class InMemoryUserRepository(UserRepository):
         user.tokens[provider] = token
         user.updated_at = datetime.now(UTC)
 
-        logger.info(f"Saved {provider} token for user {uid}")
+        logger.info("Saved %s token for user %s", provider, uid)
         return token
 
     async def get_token(self, uid: str, provider: str) -> OAuthToken | None:
@@ -190,7 +190,7 @@ class InMemoryUserRepository(UserRepository):
 
         del user.tokens[provider]
         user.updated_at = datetime.now(UTC)
-        logger.info(f"Deleted {provider} token for user {uid}")
+        logger.info("Deleted %s token for user %s", provider, uid)
         return True
 
     async def list_connections(self, uid: str) -> list[str]:
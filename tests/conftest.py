@@ -3,7 +3,7 @@ Shared test configuration and fixtures.
 """
 
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -17,10 +17,12 @@ with patch.dict(
         "BASE_URL": "http://testserver",
     },
 ):
+    from app.auth.services import _session_claims_cache
     from app.main import app, get_event_publisher
 
-# Create a single mock publisher for all tests
+# Create a single mock publisher for all tests (publish is a coroutine)
 mock_event_publisher = MagicMock()
+mock_event_publisher.publish = AsyncMock()
 
 # Use FastAPI's dependency_overrides to replace the real publisher with our mock
 app.dependency_overrides[get_event_publisher] = lambda: mock_event_publisher
@@ -42,6 +44,14 @@ def reset_mock_event_publisher():
     mock_event_publisher.publish.side_effect = None
 
 
+@pytest.fixture(autouse=True)
+def clear_session_claims_cache():
+    """Start every test without cached session claims from earlier tests."""
+    _session_claims_cache.clear()
+    yield
+    _session_claims_cache.clear()
+
+
 @pytest.fixture
 def sample_frameio_payload():
     """Sample Frame.io V4 webhook payload."""
@@ -2,7 +2,9 @@
 Tests for magic link authentication endpoints.
 """
 
+import asyncio
 import os
+import time
 from unittest.mock import MagicMock, patch, AsyncMock
 
 import pytest
@@ -18,7 +20,7 @@ with patch.dict(
     },
 ):
     from app.main import app
-    from app.auth.config import get_auth_config, AuthConfig
+    from app.auth.config import AuthConfig, get_auth_config, get_auth_config_dependency
     from app.auth.dependencies import get_current_user
     from app.api.magic import (
         get_magic_link_service,
@@ -41,6 +43,10 @@ def mock_auth_config():
     config.callback_url = "http://localhost:8080/auth/magic/callback"
     config.session_cookie_name = "session"
     config.session_cookie_max_age = 1209600
+    config.cookie_secure = False
+    config.session_cookie_header.side_effect = lambda value: (
+        f"session={value}; HttpOnly; Max-Age=1209600; Path=/; SameSite=lax"
+    )
     config.validate.return_value = None
     return config
 
@@ -48,10 +54,10 @@ def mock_auth_config():
 @pytest.fixture
 def client_with_mock_config(mock_auth_config):
     """Test client with mocked auth config."""
-    app.dependency_overrides[get_auth_config] = lambda: mock_auth_config
+    app.dependency_overrides[get_auth_config_dependency] = lambda: mock_auth_config
     client = TestClient(app)
     yield client
-    app.dependency_overrides.pop(get_auth_config, None)
+    app.dependency_overrides.pop(get_auth_config_dependency, None)
 
 
 @pytest.fixture
@@ -76,7 +82,7 @@ class TestMagicLinkSendEndpoint:
             "https://example.firebaseapp.com/__/auth/action?oobCode=test123"
         )
 
-        app.dependency_overrides[get_auth_config] = lambda: mock_auth_config
+        app.dependency_overrides[get_auth_config_dependency] = lambda: mock_auth_config
         app.dependency_overrides[get_magic_link_service] = lambda: mock_service
         client = TestClient(app)
 
@@ -92,7 +98,7 @@ class TestMagicLinkSendEndpoint:
             assert "Magic link generated" in data["message"]
             mock_service.generate_magic_link.assert_called_once_with("test@example.com")
         finally:
-            app.dependency_overrides.pop(get_auth_config, None)
+            app.dependency_overrides.pop(get_auth_config_dependency, None)
             app.dependency_overrides.pop(get_magic_link_service, None)
 
     def test_send_requires_email(self, client_with_mock_config):
@@ -109,6 +115,14 @@ class TestMagicLinkSendEndpoint:
 
         assert response.status_code == 422  # Validation error
 
+    def test_send_rejects_overlong_email(self, client_with_mock_config):
+        """Test that send endpoint rejects addresses over 254 characters."""
+        response = client_with_mock_config.post(
+            "/auth/magic/send", json={"email": f"{'a' * 250}@example.com"}
+        )
+
+        assert response.status_code == 422  # Validation error
+
     def test_send_handles_firebase_error(self, mock_auth_config):
         """Test error handling when Firebase fails."""
         from app.auth.services import AuthenticationError
@@ -118,7 +132,7 @@ class TestMagicLinkSendEndpoint:
             "Firebase error"
         )
 
-        app.dependency_overrides[get_auth_config] = lambda: mock_auth_config
+        app.dependency_overrides[get_auth_config_dependency] = lambda: mock_auth_config
         app.dependency_overrides[get_magic_link_service] = lambda: mock_service
         client = TestClient(app)
 
@@ -130,31 +144,9 @@ class TestMagicLinkSendEndpoint:
             assert response.status_code == 500
             assert "Firebase error" in response.json()["detail"]
         finally:
-            app.dependency_overrides.pop(get_auth_config, None)
+            app.dependency_overrides.pop(get_auth_config_dependency, None)
             app.dependency_overrides.pop(get_magic_link_service, None)
 
-    def test_send_requires_firebase_api_key(self):
-        """Test that send fails without Firebase API key."""
-        # Create config with empty API key
-        invalid_config = MagicMock(spec=AuthConfig)
-        invalid_config.firebase_web_api_key = ""
-        invalid_config.base_url = "http://localhost:8080"
-        invalid_config.validate.side_effect = ValueError(
-            "FIREBASE_WEB_API_KEY environment variable is required"
-        )
-
-        app.dependency_overrides[get_auth_config] = lambda: invalid_config
-        client = TestClient(app)
-
-        try:
-            response = client.post(
-                "/auth/magic/send", json={"email": "test@example.com"}
-            )
-            assert response.status_code == 500
-            assert "FIREBASE_WEB_API_KEY" in response.json()["detail"]
-        finally:
-            app.dependency_overrides.pop(get_auth_config, None)
-
 
 # ============================================================================
 # GET /auth/magic/callback Tests
@@ -175,7 +167,7 @@ class TestMagicLinkCallbackEndpoint:
         mock_session_service = MagicMock()
         mock_session_service.create_session_cookie.return_value = "mock-session-cookie"
 
-        app.dependency_overrides[get_auth_config] = lambda: mock_auth_config
+        app.dependency_overrides[get_auth_config_dependency] = lambda: mock_auth_config
         app.dependency_overrides[get_token_exchange_service] = (
             lambda: mock_token_service
         )
@@ -197,8 +189,9 @@ class TestMagicLinkCallbackEndpoint:
 
             # Should set session cookie
             assert "session" in response.cookies
+            assert "HttpOnly" in response.headers["set-cookie"]
         finally:
-            app.dependency_overrides.pop(get_auth_config, None)
+            app.dependency_overrides.pop(get_auth_config_dependency, None)
             app.dependency_overrides.pop(get_token_exchange_service, None)
             app.dependency_overrides.pop(get_session_cookie_service, None)
 
@@ -230,7 +223,7 @@ class TestMagicLinkCallbackEndpoint:
             side_effect=AuthenticationError("Invalid oobCode")
         )
 
-        app.dependency_overrides[get_auth_config] = lambda: mock_auth_config
+        app.dependency_overrides[get_auth_config_dependency] = lambda: mock_auth_config
         app.dependency_overrides[get_token_exchange_service] = (
             lambda: mock_token_service
         )
@@ -245,10 +238,28 @@ class TestMagicLinkCallbackEndpoint:
             assert response.status_code == 401
             assert "Invalid oobCode" in response.json()["detail"]
         finally:
-            app.dependency_overrides.pop(get_auth_config, None)
+            app.dependency_overrides.pop(get_auth_config_dependency, None)
             app.dependency_overrides.pop(get_token_exchange_service, None)
 
 
+# ============================================================================
+# GET /auth/magic/dashboard Tests
+# ============================================================================
+
+
+class TestMagicDashboardRedirect:
+    """Tests for the GET /auth/magic/dashboard redirect."""
+
+    def test_redirects_to_dashboard(self, client):
+        """Test the magic link dashboard path redirects to /dashboard."""
+        for _ in range(2):
+            response = client.get("/auth/magic/dashboard", follow_redirects=False)
+
+            assert response.status_code == 302
+            assert response.headers["location"] == "/dashboard"
+            assert "set-cookie" not in response.headers
+
+
 # ============================================================================
 # GET /dashboard Tests
 # ============================================================================
@@ -364,6 +375,21 @@ class TestAuthConfig:
             assert config.firebase_web_api_key == "test-key-123"
             assert config.base_url == "https://example.com"
             assert config.callback_url == "https://example.com/auth/magic/callback"
+            assert config.cookie_secure is True
+            assert config.session_cookie_header("abc.def.ghi") == (
+                "session=abc.def.ghi; HttpOnly; Max-Age=1209600; Path=/; "
+                "SameSite=lax; Secure"
+            )
+
+    def test_get_auth_config_is_singleton_until_reset(self):
+        """Test get_auth_config returns one instance until it is reset."""
+        from app.auth.config import reset_auth_config
+
+        first = get_auth_config()
+        assert get_auth_config() is first
+
+        reset_auth_config()
+        assert get_auth_config() is not first
 
     def test_config_validation_requires_api_key(self):
         """Test config validation fails without API key."""
@@ -405,10 +431,41 @@ class TestMagicLinkService:
         assert link == "https://example.firebaseapp.com/__/auth/action"
         mock_firebase.generate_sign_in_with_email_link.assert_called_once()
 
+    @patch("app.auth.services.get_firebase_auth")
+    @patch("app.auth.services.get_auth_config")
+    def test_generate_magic_link_encodes_email_in_callback(
+        self, mock_get_config, mock_get_auth
+    ):
+        """Test the email is percent-encoded into the callback URL."""
+        from app.auth.services import MagicLinkService
+
+        mock_config = MagicMock()
+        mock_config.callback_url = "http://localhost:8080/auth/magic/callback"
+        mock_get_config.return_value = mock_config
+        mock_firebase = MagicMock()
+        mock_get_auth.return_value = mock_firebase
+
+        MagicLinkService().generate_magic_link("first+tag@example.com")
+
+        call = mock_firebase.generate_sign_in_with_email_link.call_args
+        assert call.kwargs["action_code_settings"].url == (
+            "http://localhost:8080/auth/magic/callback?email=first%2Btag@example.com"
+        )
+
 
 class TestSessionCookieService:
     """Tests for SessionCookieService."""
 
+    @patch("app.auth.services.get_firebase_auth")
+    @patch("app.auth.services.get_auth_config")
+    def test_init_does_not_initialize_firebase(self, mock_get_config, mock_get_auth):
+        """Test Firebase is resolved on first use, not at construction."""
+        from app.auth.services import SessionCookieService
+
+        SessionCookieService()
+
+        mock_get_auth.assert_not_called()
+
     @patch("app.auth.services.get_firebase_auth")
     @patch("app.auth.services.get_auth_config")
     def test_create_session_cookie(self, mock_get_config, mock_get_auth):
@@ -455,13 +512,127 @@ class TestSessionCookieService:
         assert claims["email"] == "test@example.com"
         mock_firebase.verify_session_cookie.assert_called_once_with(
             session_cookie="session-cookie",
+            check_revoked=False,
+        )
+
+    @patch("app.auth.services.get_firebase_auth")
+    @patch("app.auth.services.get_auth_config")
+    def test_verify_session_cookie_caches_claims(self, mock_get_config, mock_get_auth):
+        """Test repeated verification of the same cookie only calls Firebase once."""
+        from app.auth.services import SessionCookieService
+
+        mock_config = MagicMock()
+        mock_get_config.return_value = mock_config
+
+        mock_firebase = MagicMock()
+        mock_firebase.verify_session_cookie.return_value = {
+            "uid": "cached-uid",
+            "email": "cached@example.com",
+        }
+        mock_get_auth.return_value = mock_firebase
+
+        service = SessionCookieService()
+        first = service.verify_session_cookie("cacheable-session-cookie")
+        second = service.verify_session_cookie("cacheable-session-cookie")
+
+        assert first == second
+        assert second["uid"] == "cached-uid"
+        mock_firebase.verify_session_cookie.assert_called_once()
+
+    @patch("app.auth.services.get_firebase_auth")
+    @patch("app.auth.services.get_auth_config")
+    def test_strict_verify_does_not_reuse_unchecked_result(
+        self, mock_get_config, mock_get_auth
+    ):
+        """Test a revocation-checked verify is not served a lighter cached one."""
+        from app.auth.services import SessionCookieService
+
+        mock_firebase = MagicMock()
+        mock_firebase.verify_session_cookie.return_value = {"uid": "strict-uid"}
+        mock_get_auth.return_value = mock_firebase
+
+        service = SessionCookieService()
+        service.verify_session_cookie("strict-session-cookie")
+        service.verify_session_cookie("strict-session-cookie", check_revoked=True)
+
+        assert mock_firebase.verify_session_cookie.call_count == 2
+        mock_firebase.verify_session_cookie.assert_called_with(
+            session_cookie="strict-session-cookie",
             check_revoked=True,
         )
 
+    @patch("app.auth.services.get_firebase_auth")
+    @patch("app.auth.services.get_auth_config")
+    def test_verify_session_cookie_does_not_cache_past_expiry(
+        self, mock_get_config, mock_get_auth
+    ):
+        """Test claims are not served from cache after the cookie expires."""
+        from app.auth.services import SessionCookieService
+
+        mock_firebase = MagicMock()
+        mock_firebase.verify_session_cookie.return_value = {
+            "uid": "expiring-uid",
+            "exp": time.time() - 1,
+        }
+        mock_get_auth.return_value = mock_firebase
+
+        service = SessionCookieService()
+        service.verify_session_cookie("expiring-session-cookie")
+        service.verify_session_cookie("expiring-session-cookie")
+
+        assert mock_firebase.verify_session_cookie.call_count == 2
+
+
+class TestCurrentUserDependency:
+    """Tests for the get_current_user dependency."""
+
+    @pytest.mark.asyncio
+    async def test_cached_session_is_served_on_event_loop(self):
+        """Test a cache hit skips the thread pool used for verification."""
+        service = MagicMock()
+        service.get_cached_claims.return_value = {"uid": "cached-uid"}
+
+        with patch("app.auth.dependencies.asyncio.to_thread") as mock_to_thread:
+            claims = await get_current_user(
+                session="cached-session-cookie", session_service=service
+            )
+
+        assert claims == {"uid": "cached-uid"}
+        service.get_cached_claims.assert_called_once_with(
+            "cached-session-cookie", False
+        )
+        mock_to_thread.assert_not_called()
+
 
 class TestTokenExchangeService:
     """Tests for TokenExchangeService."""
 
+    @pytest.mark.asyncio
+    async def test_http_client_is_shared_until_closed(self):
+        """Test one HTTP client is reused across exchanges until shutdown."""
+        from app.auth.services import close_http_client, get_http_client
+
+        first = get_http_client()
+        assert get_http_client() is first
+
+        await close_http_client()
+        assert first.is_closed
+        assert get_http_client() is not first
+        await close_http_client()
+
+    def test_http_client_is_rebuilt_for_a_new_event_loop(self):
+        """Test a client bound to a closed event loop is not reused."""
+        from app.auth.services import close_http_client, get_http_client
+
+        async def current_client():
+            return get_http_client()
+
+        first = asyncio.run(current_client())
+        second = asyncio.run(current_client())
+
+        assert second is not first
+        asyncio.run(close_http_client())
+
     @pytest.mark.asyncio
     @patch("app.auth.services.get_auth_config")
     async def test_exchange_oob_code_success(self, mock_get_config):
@@ -470,20 +641,18 @@ class TestTokenExchangeService:
 
         mock_config = MagicMock()
         mock_config.firebase_web_api_key = "test-api-key"
+        mock_config.using_emulator = False
         mock_get_config.return_value = mock_config
 
         # Create mock response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"idToken": "mock-id-token"}
+        mock_response.content = b'{"idToken": "mock-id-token"}'
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.post.return_value = mock_response
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client_class.return_value = mock_client
+        mock_client = AsyncMock()
+        mock_client.post.return_value = mock_response
 
+        with patch("app.auth.services.get_http_client", return_value=mock_client):
             service = TokenExchangeService()
             token = await service.exchange_oob_code_for_id_token(
                 oob_code="test-oob-code",
@@ -491,6 +660,10 @@ class TestTokenExchangeService:
             )
 
             assert token == "mock-id-token"
+            assert mock_client.post.call_args.args[0] == (
+                "https://identitytoolkit.googleapis.com/v1/"
+                "accounts:signInWithEmailLink?key=test-api-key"
+            )
 
     @pytest.mark.asyncio
     @patch("app.auth.services.get_auth_config")
@@ -505,15 +678,12 @@ class TestTokenExchangeService:
         # Create mock error response
         mock_response = MagicMock()
         mock_response.status_code = 400
-        mock_response.json.return_value = {"error": {"message": "INVALID_OOB_CODE"}}
+        mock_response.content = b'{"error": {"message": "INVALID_OOB_CODE"}}'
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.post.return_value = mock_response
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client_class.return_value = mock_client
+        mock_client = AsyncMock()
+        mock_client.post.return_value = mock_response
 
+        with patch("app.auth.services.get_http_client", return_value=mock_client):
             service = TokenExchangeService()
 
             with pytest.raises(AuthenticationError, match="INVALID_OOB_CODE"):
@@ -521,3 +691,29 @@ class TestTokenExchangeService:
                     oob_code="invalid-code",
                     email="test@example.com",
                 )
+
+    @pytest.mark.asyncio
+    @patch("app.auth.services.get_auth_config")
+    async def test_exchange_oob_code_non_json_error(self, mock_get_config):
+        """Test a non-JSON error body still raises AuthenticationError."""
+        from app.auth.services import TokenExchangeService, AuthenticationError
+
+        mock_config = MagicMock()
+        mock_config.firebase_web_api_key = "test-api-key"
+        mock_get_config.return_value = mock_config
+
+        mock_response = MagicMock()
+        mock_response.status_code = 502
+        mock_response.content = b"<html>Bad Gateway</html>"
+
+        mock_client = AsyncMock()
+        mock_client.post.return_value = mock_response
+
+        with patch("app.auth.services.get_http_client", return_value=mock_client):
+            service = TokenExchangeService()
+
+            with pytest.raises(AuthenticationError, match="Unknown error"):
+                await service.exchange_oob_code_for_id_token(
+                    oob_code="test-oob-code",
+                    email="test@example.com",
+                )
@@ -3,8 +3,9 @@ Tests for application lifecycle events.
 """
 
 import os
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import pytest
 from fastapi.testclient import TestClient
 
 # Import app for lifecycle testing
@@ -12,6 +13,15 @@ with patch.dict(os.environ, {"GCP_PROJECT_ID": "test-project"}):
     from app.main import app
 
 
+@pytest.fixture(autouse=True)
+def valid_auth_config():
+    """Startup validates auth config; provide one that passes."""
+    config = MagicMock()
+    config.validate.return_value = None
+    with patch("app.main.get_auth_config", return_value=config):
+        yield config
+
+
 class TestApplicationLifecycle:
     """Test application lifecycle events."""
 
@@ -35,3 +45,37 @@ class TestApplicationLifecycle:
                 )
                 assert response.status_code == 200
                 # TestClient context manager will trigger shutdown on exit
+
+    def test_shutdown_closes_created_publisher(self):
+        """Test shutdown closes the publisher singleton once it exists."""
+        publisher = MagicMock()
+        with patch("app.main._event_publisher", publisher):
+            with TestClient(app):
+                pass
+
+        publisher.close.assert_called_once()
+
+    def test_startup_initializes_firebase(self):
+        """Test startup initializes Firebase before the first request."""
+        with patch("app.main.initialize_firebase") as mock_initialize:
+            with TestClient(app):
+                mock_initialize.assert_called_once()
+
+    def test_startup_survives_firebase_failure(self):
+        """Test a Firebase init failure does not prevent the app serving."""
+        with patch(
+            "app.main.initialize_firebase", side_effect=RuntimeError("no credentials")
+        ):
+            with TestClient(app) as test_client:
+                response = test_client.get("/health")
+                assert response.status_code == 200
+
+    def test_startup_fails_on_invalid_auth_config(self, valid_auth_config):
+        """Test startup fails fast when auth configuration is invalid."""
+        valid_auth_config.validate.side_effect = ValueError(
+            "FIREBASE_WEB_API_KEY environment variable is required"
+        )
+
+        with pytest.raises(ValueError, match="FIREBASE_WEB_API_KEY"):
+            with TestClient(app):
+                pass
@@ -0,0 +1,68 @@
+"""
+Tests for logging configuration.
+"""
+
+import logging
+from logging.handlers import QueueHandler
+from unittest.mock import patch
+
+import pytest
+
+from app import logging_config
+
+
+@pytest.fixture
+def root_logger():
+    """
+    Provide the root logger and restore its handlers and level afterwards.
+
+    pytest attaches its capture handlers for the duration of each test, so
+    tests clear the handlers themselves before configuring logging.
+    """
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    with patch.object(logging_config, "_queue_listener", None):
+        yield root
+        logging_config.stop_queue_listener()
+    root.handlers = saved_handlers
+    root.setLevel(saved_level)
+
+
+class TestQueuedLogging:
+    """Test handlers are served from a queue off the logging thread."""
+
+    def test_stdout_logging_installs_queue_handler(self, root_logger):
+        """Test the root logger only keeps a QueueHandler."""
+        root_logger.handlers = []
+
+        logging_config._setup_stdout_logging()
+
+        handlers = root_logger.handlers
+        assert len(handlers) == 1
+        assert isinstance(handlers[0], QueueHandler)
+        assert root_logger.level == logging.INFO
+
+    def test_records_reach_original_handler(self, root_logger):
+        """Test records logged at the root are delivered by the listener."""
+        records: list[logging.LogRecord] = []
+        handler = logging.Handler()
+        handler.emit = records.append  # type: ignore[method-assign]
+        root_logger.handlers = [handler]
+        root_logger.setLevel(logging.INFO)
+
+        logging_config._serve_root_handlers_from_queue([handler])
+        logging.getLogger("test").info("queued %s", "record")
+        logging_config.stop_queue_listener()
+
+        assert handler not in root_logger.handlers
+        assert [r.getMessage() for r in records] == ["queued record"]
+
+    def test_existing_handlers_are_left_alone(self, root_logger):
+        """Test stdout logging does nothing if handlers are already installed."""
+        handler = logging.NullHandler()
+        root_logger.handlers = [handler]
+
+        logging_config._setup_stdout_logging()
+
+        assert root_logger.handlers == [handler]
+        assert logging_config._queue_listener is None
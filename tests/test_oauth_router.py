@@ -20,7 +20,7 @@ with patch.dict(
     },
 ):
     from app.main import app
-    from app.auth.dependencies import get_current_user
+    from app.auth.dependencies import get_current_user, get_current_user_strict
     from app.oauth.dependencies import get_repository
     from app.oauth.config import get_oauth_config, OAuthConfig
     from app.users.repository import InMemoryUserRepository
@@ -59,16 +59,24 @@ def mock_repository():
 
 
 @pytest.fixture
-def authenticated_client(mock_user, mock_oauth_config, mock_repository):
-    """Test client with mocked authentication."""
+def override_current_user(mock_user):
+    """Authenticate as mock_user for both the plain and strict dependencies."""
     app.dependency_overrides[get_current_user] = lambda: mock_user
+    app.dependency_overrides[get_current_user_strict] = lambda: mock_user
+    yield mock_user
+    app.dependency_overrides.pop(get_current_user, None)
+    app.dependency_overrides.pop(get_current_user_strict, None)
+
+
+@pytest.fixture
+def authenticated_client(override_current_user, mock_oauth_config, mock_repository):
+    """Test client with mocked authentication."""
     app.dependency_overrides[get_oauth_config] = lambda: mock_oauth_config
     app.dependency_overrides[get_repository] = lambda: mock_repository
 
     client = TestClient(app)
     yield client
 
-    app.dependency_overrides.pop(get_current_user, None)
     app.dependency_overrides.pop(get_oauth_config, None)
     app.dependency_overrides.pop(get_repository, None)
 
@@ -78,6 +86,7 @@ def unauthenticated_client(mock_oauth_config):
     """Test client without authentication but with OAuth config mocked."""
     # Remove auth override but keep OAuth config so provider validation passes
     app.dependency_overrides.pop(get_current_user, None)
+    app.dependency_overrides.pop(get_current_user_strict, None)
     app.dependency_overrides[get_oauth_config] = lambda: mock_oauth_config
 
     client = TestClient(app)
@@ -103,11 +112,12 @@ class TestOAuthConnectEndpoint:
 
         assert response.status_code == 401
 
-    def test_connect_unknown_provider_returns_404(self, mock_user, mock_oauth_config):
+    def test_connect_unknown_provider_returns_404(
+        self, override_current_user, mock_oauth_config
+    ):
         """Test connect with unknown provider returns 404."""
         mock_oauth_config.is_provider_configured.return_value = False
 
-        app.dependency_overrides[get_current_user] = lambda: mock_user
         app.dependency_overrides[get_oauth_config] = lambda: mock_oauth_config
 
         client = TestClient(app)
@@ -119,15 +129,13 @@ class TestOAuthConnectEndpoint:
             )
             assert response.status_code == 404
         finally:
-            app.dependency_overrides.pop(get_current_user, None)
             app.dependency_overrides.pop(get_oauth_config, None)
 
-    def test_connect_unconfigured_provider_returns_503(self, mock_user):
+    def test_connect_unconfigured_provider_returns_503(self, override_current_user):
         """Test connect with unconfigured provider returns 503."""
         mock_config = MagicMock(spec=OAuthConfig)
         mock_config.is_provider_configured.return_value = False
 
-        app.dependency_overrides[get_current_user] = lambda: mock_user
         app.dependency_overrides[get_oauth_config] = lambda: mock_config
 
         client = TestClient(app)
@@ -140,7 +148,6 @@ class TestOAuthConnectEndpoint:
             assert response.status_code == 503
             assert "not configured" in response.json()["detail"]
         finally:
-            app.dependency_overrides.pop(get_current_user, None)
             app.dependency_overrides.pop(get_oauth_config, None)
 
 
@@ -158,12 +165,13 @@ class TestListConnectionsEndpoint:
         assert response.status_code == 401
 
     @pytest.mark.asyncio
-    async def test_list_connections_empty(self, mock_user, mock_repository):
+    async def test_list_connections_empty(
+        self, mock_user, override_current_user, mock_repository
+    ):
         """Test list connections returns empty list."""
         # Create user first
         await mock_repository.get_or_create(mock_user["uid"], mock_user["email"])
 
-        app.dependency_overrides[get_current_user] = lambda: mock_user
         app.dependency_overrides[get_repository] = lambda: mock_repository
 
         client = TestClient(app)
@@ -173,18 +181,18 @@ class TestListConnectionsEndpoint:
             assert response.status_code == 200
             assert response.json()["connections"] == []
         finally:
-            app.dependency_overrides.pop(get_current_user, None)
             app.dependency_overrides.pop(get_repository, None)
 
     @pytest.mark.asyncio
-    async def test_list_connections_with_providers(self, mock_user, mock_repository):
+    async def test_list_connections_with_providers(
+        self, mock_user, override_current_user, mock_repository
+    ):
         """Test list connections returns connected providers."""
         await mock_repository.get_or_create(mock_user["uid"], mock_user["email"])
         await mock_repository.save_token(
             mock_user["uid"], "google", {"access_token": "test"}
         )
 
-        app.dependency_overrides[get_current_user] = lambda: mock_user
         app.dependency_overrides[get_repository] = lambda: mock_repository
 
         client = TestClient(app)
@@ -194,7 +202,6 @@ class TestListConnectionsEndpoint:
             assert response.status_code == 200
             assert "google" in response.json()["connections"]
         finally:
-            app.dependency_overrides.pop(get_current_user, None)
             app.dependency_overrides.pop(get_repository, None)
 
 
@@ -213,12 +220,11 @@ class TestDisconnectEndpoint:
 
     @pytest.mark.asyncio
     async def test_disconnect_not_connected_returns_404(
-        self, mock_user, mock_oauth_config, mock_repository
+        self, mock_user, override_current_user, mock_oauth_config, mock_repository
     ):
         """Test disconnect when not connected returns 404."""
         await mock_repository.get_or_create(mock_user["uid"], mock_user["email"])
 
-        app.dependency_overrides[get_current_user] = lambda: mock_user
         app.dependency_overrides[get_oauth_config] = lambda: mock_oauth_config
         app.dependency_overrides[get_repository] = lambda: mock_repository
 
@@ -229,13 +235,12 @@ class TestDisconnectEndpoint:
             assert response.status_code == 404
             assert "No connection found" in response.json()["detail"]
         finally:
-            app.dependency_overrides.pop(get_current_user, None)
             app.dependency_overrides.pop(get_oauth_config, None)
             app.dependency_overrides.pop(get_repository, None)
 
     @pytest.mark.asyncio
     async def test_disconnect_success(
-        self, mock_user, mock_oauth_config, mock_repository
+        self, mock_user, override_current_user, mock_oauth_config, mock_repository
     ):
         """Test successful disconnect."""
         await mock_repository.get_or_create(mock_user["uid"], mock_user["email"])
@@ -243,7 +248,6 @@ class TestDisconnectEndpoint:
             mock_user["uid"], "google", {"access_token": "test"}
         )
 
-        app.dependency_overrides[get_current_user] = lambda: mock_user
         app.dependency_overrides[get_oauth_config] = lambda: mock_oauth_config
         app.dependency_overrides[get_repository] = lambda: mock_repository
 
@@ -258,15 +262,13 @@ class TestDisconnectEndpoint:
             token = await mock_repository.get_token(mock_user["uid"], "google")
             assert token is None
         finally:
-            app.dependency_overrides.pop(get_current_user, None)
             app.dependency_overrides.pop(get_oauth_config, None)
             app.dependency_overrides.pop(get_repository, None)
 
     def test_disconnect_unknown_provider_returns_404(
-        self, mock_user, mock_oauth_config
+        self, override_current_user, mock_oauth_config
     ):
         """Test disconnect with unknown provider returns 404."""
-        app.dependency_overrides[get_current_user] = lambda: mock_user
         app.dependency_overrides[get_oauth_config] = lambda: mock_oauth_config
 
         client = TestClient(app)
@@ -275,5 +277,4 @@ class TestDisconnectEndpoint:
             response = client.delete("/oauth/unknown")
             assert response.status_code == 404
         finally:
-            app.dependency_overrides.pop(get_current_user, None)
             app.dependency_overrides.pop(get_oauth_config, None)
@@ -2,14 +2,19 @@
 Unit tests for the GooglePubSubPublisher infrastructure adapter.
 """
 
+import json
 import os
+from concurrent.futures import Future
 from unittest.mock import MagicMock, patch
 
 import pytest
 from google.api_core import exceptions
 
 from app.core.domain import FrameIOEvent
-from app.infrastructure.pubsub_publisher import GooglePubSubPublisher
+from app.infrastructure.pubsub_publisher import (
+    GooglePubSubPublisher,
+    PUBLISH_BATCH_SETTINGS,
+)
 
 
 @pytest.fixture
@@ -44,7 +49,9 @@ class TestGooglePubSubPublisher:
 
             assert publisher.project_id == "test-project"
             assert publisher.topic_name == "test-topic"
-            mock_publisher_class.assert_called_once()
+            mock_publisher_class.assert_called_once_with(
+                batch_settings=PUBLISH_BATCH_SETTINGS
+            )
 
     def test_publisher_missing_project_id_raises_error(self):
         """Test publisher raises error when project ID is missing."""
@@ -84,7 +91,7 @@ class TestGooglePubSubPublish:
     """Test publishing messages to Pub/Sub."""
 
     @patch("app.infrastructure.pubsub_publisher.pubsub_v1.PublisherClient")
-    def test_publish_message_success(self, mock_publisher_class, sample_event):
+    async def test_publish_message_success(self, mock_publisher_class, sample_event):
         """Test successful message publishing with domain event."""
         mock_publisher = MagicMock()
         mock_publisher_class.return_value = mock_publisher
@@ -92,10 +99,10 @@ class TestGooglePubSubPublish:
             "projects/test-project/topics/test-topic"
         )
 
-        # Mock the future result
-        mock_future = MagicMock()
-        mock_future.result.return_value = "test-message-id"
-        mock_publisher.publish.return_value = mock_future
+        # Pub/Sub returns a concurrent future resolved by its background thread
+        future: Future = Future()
+        future.set_result("test-message-id")
+        mock_publisher.publish.return_value = future
 
         with patch.dict(
             os.environ,
@@ -103,11 +110,15 @@ class TestGooglePubSubPublish:
         ):
             publisher = GooglePubSubPublisher()
 
-            message_id = publisher.publish(sample_event)
+            message_id = await publisher.publish(sample_event)
 
             assert message_id == "test-message-id"
             mock_publisher.publish.assert_called_once()
 
+            # Verify the message data keeps the nested Frame.io structure
+            message_bytes = mock_publisher.publish.call_args.args[1]
+            assert json.loads(message_bytes) == sample_event.to_dict()
+
             # Verify attributes were extracted from domain object
             call_kwargs = mock_publisher.publish.call_args.kwargs
             assert call_kwargs["event_type"] == "file.created"
@@ -115,7 +126,9 @@ class TestGooglePubSubPublish:
             assert call_kwargs["resource_id"] == "test-file-123"
 
     @patch("app.infrastructure.pubsub_publisher.pubsub_v1.PublisherClient")
-    def test_publish_handles_not_found_error(self, mock_publisher_class, sample_event):
+    async def test_publish_handles_not_found_error(
+        self, mock_publisher_class, sample_event
+    ):
         """Test publish handles topic not found errors."""
         mock_publisher = MagicMock()
         mock_publisher_class.return_value = mock_publisher
@@ -132,12 +145,12 @@ class TestGooglePubSubPublish:
         ):
             publisher = GooglePubSubPublisher()
 
-            message_id = publisher.publish(sample_event)
+            message_id = await publisher.publish(sample_event)
 
             assert message_id is None
 
     @patch("app.infrastructure.pubsub_publisher.pubsub_v1.PublisherClient")
-    def test_publish_handles_permission_denied_error(
+    async def test_publish_handles_permission_denied_error(
         self, mock_publisher_class, sample_event
     ):
         """Test publish handles permission denied errors."""
@@ -158,12 +171,14 @@ class TestGooglePubSubPublish:
         ):
             publisher = GooglePubSubPublisher()
 
-            message_id = publisher.publish(sample_event)
+            message_id = await publisher.publish(sample_event)
 
             assert message_id is None
 
     @patch("app.infrastructure.pubsub_publisher.pubsub_v1.PublisherClient")
-    def test_publish_handles_generic_error(self, mock_publisher_class, sample_event):
+    async def test_publish_handles_generic_error(
+        self, mock_publisher_class, sample_event
+    ):
         """Test publish handles generic errors gracefully."""
         mock_publisher = MagicMock()
         mock_publisher_class.return_value = mock_publisher
@@ -180,7 +195,7 @@ class TestGooglePubSubPublish:
         ):
             publisher = GooglePubSubPublisher()
 
-            message_id = publisher.publish(sample_event)
+            message_id = await publisher.publish(sample_event)
 
             assert message_id is None
 
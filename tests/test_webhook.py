@@ -2,7 +2,12 @@
 Tests for Frame.io webhook endpoint.
 """
 
-from tests.conftest import client
+import json
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+from app.api.frameio import router
+from tests.conftest import app, client
 
 
 class TestFrameIOWebhook:
@@ -34,9 +39,56 @@ class TestFrameIOWebhook:
         # Check that important information was logged as structured JSON
         log_text = caplog.text
         assert "FRAME.IO WEBHOOK RECEIVED" in log_text
-        assert '"event_type": "resource.asset_created"' in log_text
-        assert '"resource_type": "asset"' in log_text
-        assert '"resource_id": "abc-123-def-456"' in log_text
+        assert '"event_type":"resource.asset_created"' in log_text
+        assert '"resource_type":"asset"' in log_text
+        assert '"resource_id":"abc-123-def-456"' in log_text
+
+    def test_webhook_log_timestamp_is_iso8601(self, sample_frameio_payload, caplog):
+        """Test the logged timestamp is a timezone-aware ISO 8601 string."""
+        with caplog.at_level("INFO", logger="app.core.services"):
+            client.post("/api/v1/frameio/webhook", json=sample_frameio_payload)
+
+        entry = next(
+            json.loads(record.getMessage())
+            for record in caplog.records
+            if "FRAME.IO WEBHOOK RECEIVED" in record.getMessage()
+        )
+        timestamp = datetime.fromisoformat(entry["timestamp"])
+        assert timestamp.tzinfo is not None
+        assert abs(datetime.now(UTC) - timestamp) < timedelta(seconds=5)
+
+    def test_webhook_logs_forwarded_client_ip_on_cloud_run(
+        self, sample_frameio_payload, caplog
+    ):
+        """Test the hop appended by Google's front end is logged on Cloud Run."""
+        with (
+            patch("app.api.frameio._BEHIND_CLOUD_RUN_PROXY", True),
+            caplog.at_level("INFO"),
+        ):
+            client.post(
+                "/api/v1/frameio/webhook",
+                json=sample_frameio_payload,
+                # The first entry is whatever the caller sent, so it is spoofable
+                headers={"X-Forwarded-For": "192.0.2.1, 203.0.113.7"},
+            )
+
+        assert '"client_ip":"203.0.113.7"' in caplog.text
+
+    def test_webhook_ignores_forwarded_for_outside_cloud_run(
+        self, sample_frameio_payload, caplog
+    ):
+        """Test X-Forwarded-For is not trusted without the Cloud Run proxy."""
+        with caplog.at_level("INFO"):
+            client.post(
+                "/api/v1/frameio/webhook",
+                json=sample_frameio_payload,
+                headers={"X-Forwarded-For": "203.0.113.7"},
+            )
+
+        # The peer comes from the ASGI scope; its value depends on the
+        # TestClient version, so only check the header was not used.
+        assert '"client_ip":' in caplog.text
+        assert '"client_ip":"203.0.113.7"' not in caplog.text
 
     def test_webhook_handles_minimal_payload(self):
         """Test webhook handles payload with all required fields."""
@@ -74,6 +126,19 @@ class TestFrameIOWebhook:
         assert data["status"] == "error"
         assert "Invalid payload schema" in data["message"]
 
+    def test_webhook_rejects_non_utf8_body(self):
+        """Test a non-UTF-8 body is a 422 and is not echoed back."""
+        response = client.post(
+            "/api/v1/frameio/webhook",
+            content=b"\xff\xfe{",
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 422
+        details = response.json()["details"]
+        assert details[0]["type"] == "json_invalid"
+        assert "input" not in details[0]
+
     def test_webhook_extracts_all_frameio_fields(self, sample_frameio_payload, caplog):
         """Test webhook extracts all Frame.io V4 fields (logged)."""
         with caplog.at_level("INFO"):
@@ -105,3 +170,29 @@ class TestFrameIOWebhook:
         # Verify response structure contains only message_id
         assert "message_id" in data
         assert len(data) == 1
+
+    def test_webhook_documents_request_body(self):
+        """Test the OpenAPI schema keeps the webhook's JSON request body."""
+        operation = app.openapi()["paths"]["/api/v1/frameio/webhook"]["post"]
+
+        content = operation["requestBody"]["content"]
+        assert "application/json" in content
+        assert "type" in content["application/json"]["schema"]["properties"]
+
+
+class TestFrameIOWebhookRouting:
+    """Test the webhook is routed to a single handler."""
+
+    def test_router_registers_one_webhook_route(self):
+        """Test the Frame.io router defines exactly one webhook route."""
+        webhook_routes = [r for r in router.routes if r.path.endswith("/webhook")]
+
+        assert len(webhook_routes) == 1
+
+    def test_app_registers_one_webhook_route(self):
+        """Test the app does not shadow the webhook with a second handler."""
+        webhook_routes = [
+            r for r in app.routes if getattr(r, "path", "") == "/api/v1/frameio/webhook"
+        ]
+
+        assert len(webhook_routes) == 1